@@ -14,12 +14,14 @@ def init():
     scene.target(window)
     scene.add(gaze)
 
+    # The position is static, so it is set once instead of on every frame
+    gaze.set_position(_position_for_time())
+
     window.on("draw", on_draw)
     window.auto_update()
 
 
 def on_draw():
-    gaze.set_position(_position_for_time())
     scene.render()
     pass
 
@@ -7,7 +7,10 @@ use crate::{
     FragmentColor, Quad,
 };
 use instant::{Duration, Instant};
-use std::sync::{Arc, RwLock};
+use std::{
+    collections::HashMap,
+    sync::{Arc, RwLock},
+};
 #[cfg(wasm)]
 use winit::platform::web::EventLoopExtWebSys;
 use winit::{
@@ -16,6 +19,7 @@ use winit::{
         ControlFlow, EventLoop as WinitEventLoop, EventLoopBuilder, EventLoopProxy,
         EventLoopWindowTarget,
     },
+    window::WindowId,
 };
 
 const RUNNING: &str = "EventLoop not available: already running";
@@ -71,6 +75,16 @@ type C<'c> = &'c mut ControlFlow;
 pub(crate) fn run_event_loop(event_loop: WinitEventLoop<Event>, app: Arc<RwLock<AppState>>) {
     let mut last_update = Instant::now();
 
+    // Resize events can arrive in bursts (i.e. while dragging a window
+    // border), so we only keep the latest size for each window and apply
+    // it once per event loop iteration, before the next redraw.
+    //
+    // The "resize" and "rescale" user callbacks are only queued by
+    // `window.call()` and run in `process_calls()`, which always happens
+    // after the pending sizes are applied. Callbacks therefore see the
+    // resized Render Target and Cameras.
+    let mut pending_resizes: HashMap<WindowId, Quad> = HashMap::new();
+
     let event_handler = Box::new(move |event: E, _elwt: W, control_flow: C| {
         let app = app.try_read();
 
@@ -124,43 +138,9 @@ pub(crate) fn run_event_loop(event_loop: WinitEventLoop<Event>, app: Arc<RwLock<
                     // The size of the window has changed.
                     // Contains the client area's new dimensions.
                     WindowEvent::Resized(physical_size) => {
-                        let size = Quad::from_window_size(physical_size).to_wgpu_size();
-
                         if window.auto_resize {
-                            let renderer = FragmentColor::renderer();
-                            let renderer = if let Ok(renderer) = renderer.try_read() {
-                                renderer
-                            } else {
-                                log::error!("Renderer is locked. Cannot auto-resize Render Target for Window {:?}!", window_id);
-                                return;
-                            };
-
-                            if let Ok(mut targets) = renderer.write_targets() {
-                                if let Some(target) = targets.get_mut(&target_id) {
-                                    if let Err(result) = target.resize(&renderer, size) {
-                                        log::error!(
-                                            "Failed to auto-resize Render Target for Window {:?}! {:?}",
-                                            window_id,
-                                            result
-                                        );
-                                    }
-                                } else {
-                                    log::warn!("Target not found! Cannot auto-resize Render Target for Window {:?}!", window_id);
-                                };
-                            } else {
-                                log::error!("Renderer Targets are locked. Cannot auto-resize Render Target for Window {:?}!", window_id);
-                                return;
-                            };
-
-                            let mut scenes = app.write_to_scenes_collection();
-                            let keys = scenes.keys.clone();
-                            for scene_id in keys.iter() {
-                                if let Some(mut scene) = scenes.get_mut(scene_id) {
-                                    scene.resize_target(target_id, Quad::from_wgpu_size(size))
-                                } else {
-                                    continue;
-                                };
-                            }
+                            let size = Quad::from_window_size(physical_size);
+                            pending_resizes.insert(window_id, size);
                         }
 
                         window.call(
@@ -189,33 +169,10 @@ pub(crate) fn run_event_loop(event_loop: WinitEventLoop<Event>, app: Arc<RwLock<
                         scale_factor,
                         new_inner_size,
                     } => {
-                        let size = Quad::from_window_size(new_inner_size).to_wgpu_size();
-
                         if window.auto_resize {
-                            let renderer = FragmentColor::renderer();
-                            let renderer = if let Ok(renderer) = renderer.try_read() {
-                                renderer
-                            } else {
-                                log::error!("Renderer is locked. Cannot auto-rescale Render Target for Window {:?}!", window_id);
-                                return;
-                            };
-
-                            if let Ok(mut targets) = renderer.write_targets() {
-                                if let Some(target) = targets.get_mut(&target_id) {
-                                    _ = target.resize(&renderer, size);
-                                };
-                            };
-
-                            let mut scenes = app.write_to_scenes_collection();
-                            let keys = scenes.keys.clone();
-                            for scene_id in keys.iter() {
-                                if let Some(mut scene) = scenes.get_mut(scene_id) {
-                                    scene.resize_target(target_id, Quad::from_wgpu_size(size))
-                                } else {
-                                    continue;
-                                };
-                            }
-                        };
+                            let size = Quad::from_window_size(new_inner_size);
+                            pending_resizes.insert(window_id, size);
+                        }
 
                         window.call(
                             "rescale",
@@ -251,6 +208,7 @@ pub(crate) fn run_event_loop(event_loop: WinitEventLoop<Event>, app: Arc<RwLock<
                         };
                         drop(window);
                         drop(windows);
+                        pending_resizes.remove(&window_id);
 
                         if let Ok(mut targets) = renderer.write_targets() {
                             targets.remove(&target_id);
@@ -354,6 +312,7 @@ pub(crate) fn run_event_loop(event_loop: WinitEventLoop<Event>, app: Arc<RwLock<
                                 log::error!("Renderer is locked. Cannot remove Render Target for closing Window {:?}!", window_id);
                                 return;
                             };
+                            pending_resizes.remove(&window_id);
 
                             if let Ok(mut targets) = renderer.write_targets() {
                                 targets.remove(&target_id);
@@ -588,7 +547,22 @@ pub(crate) fn run_event_loop(event_loop: WinitEventLoop<Event>, app: Arc<RwLock<
             // it's usually better to do it in response to Event::RedrawRequested, which gets
             // emitted immediately after this event. Programs that draw graphics continuously,
             // like most games, can render here unconditionally for simplicity.
-            Winit::MainEventsCleared => {}
+            Winit::MainEventsCleared => {
+                if pending_resizes.is_empty() {
+                    return;
+                }
+
+                let app = if let Ok(app) = app {
+                    app
+                } else {
+                    log::error!("App is locked! Cannot auto-resize Render Targets.");
+                    return;
+                };
+
+                for (window_id, size) in pending_resizes.drain() {
+                    auto_resize_target(&app, window_id, size);
+                }
+            }
 
             // Emitted after all [RedrawRequested] events have been processed and control flow
             // is about to be taken away from the program. If there are no RedrawRequested events,
@@ -604,6 +578,13 @@ pub(crate) fn run_event_loop(event_loop: WinitEventLoop<Event>, app: Arc<RwLock<
                     return;
                 };
 
+                // MainEventsCleared normally applies these already. This
+                // keeps the queued "resize" callbacks below from ever
+                // running against the old Render Target size.
+                for (window_id, size) in pending_resizes.drain() {
+                    auto_resize_target(&app, window_id, size);
+                }
+
                 let windows = app.read_windows_collection();
                 for window_id in windows.keys.iter() {
                     if let Some(window) = windows.get(window_id) {
@@ -638,3 +619,55 @@ pub(crate) fn run_event_loop(event_loop: WinitEventLoop<Event>, app: Arc<RwLock<
     #[cfg(not(wasm))]
     event_loop.run(event_handler);
 }
+
+/// Resizes the Render Target of a Window and updates
+/// every Scene that renders to it.
+///
+/// Applies the latest size recorded by the `Resized`
+/// and `ScaleFactorChanged` events.
+fn auto_resize_target(app: &AppState, window_id: WindowId, size: Quad) {
+    let target_id = TargetId::Window(window_id);
+    let wgpu_size = size.to_wgpu_size();
+
+    let renderer = FragmentColor::renderer();
+    let renderer = if let Ok(renderer) = renderer.try_read() {
+        renderer
+    } else {
+        log::error!(
+            "Renderer is locked. Cannot auto-resize Render Target for Window {:?}!",
+            window_id
+        );
+        return;
+    };
+
+    if let Ok(mut targets) = renderer.write_targets() {
+        if let Some(target) = targets.get_mut(&target_id) {
+            if let Err(result) = target.resize(&renderer, wgpu_size) {
+                log::error!(
+                    "Failed to auto-resize Render Target for Window {:?}! {:?}",
+                    window_id,
+                    result
+                );
+            }
+        } else {
+            log::warn!(
+                "Target not found! Cannot auto-resize Render Target for Window {:?}!",
+                window_id
+            );
+        };
+    } else {
+        log::error!(
+            "Renderer Targets are locked. Cannot auto-resize Render Target for Window {:?}!",
+            window_id
+        );
+        return;
+    };
+
+    let mut scenes = app.write_to_scenes_collection();
+    let keys = scenes.keys.clone();
+    for scene_id in keys.iter() {
+        if let Some(mut scene) = scenes.get_mut(scene_id) {
+            scene.resize_target(target_id, size)
+        };
+    }
+}
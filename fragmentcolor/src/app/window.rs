@@ -47,7 +47,7 @@ pub trait EventListener {
 
 pub(crate) trait EventProcessor: EventListener {
     fn call(&self, name: &str, event: Event);
-    fn call_later(&self, at: Instant, name: &str, event: Event);
+    fn call_later(&self, at: Instant, name: &'static str, event: Event);
     fn process_calls(&self);
 }
 
@@ -62,7 +62,7 @@ pub struct WindowState {
     reverse_lookup: HashMap<PathBuf, u128>,
     callbacks: HashMap<String, Vec<Callback<Event>>>,
     callstack: RwLock<CallStack>,
-    scheduled: RwLock<BTreeMap<Instant, (String, Event)>>,
+    scheduled: RwLock<BTreeMap<Instant, (&'static str, Event)>>,
 }
 
 unsafe impl Send for WindowState {}
@@ -118,12 +118,16 @@ impl EventProcessor for WindowState {
     ///
     /// The event will be processed at the given time.
     ///
+    /// Scheduled events are usually recurring (like "draw"), so the
+    /// event name must be a static string to avoid allocating a new
+    /// String every time an event is scheduled.
+    ///
     /// # Errors
     /// - If the Scheduled Events map is already locked by other process,
     ///   the event will be dropped silently and the Window will log an Error.
-    fn call_later(&self, time: Instant, name: &str, event: Event) {
+    fn call_later(&self, time: Instant, name: &'static str, event: Event) {
         if let Ok(mut scheduled) = self.scheduled.try_write() {
-            scheduled.insert(time, (name.to_string(), event));
+            scheduled.insert(time, (name, event));
         } else {
             log::error!(
                 "Failed to acquire the Scheduled Events Mutex for for WindowState.call_later({:?}, {}, {:?})!",
@@ -147,7 +151,7 @@ impl EventProcessor for WindowState {
             let mut future_events = scheduled.split_off(&Instant::now());
 
             while let Some((_, (name, event))) = scheduled.pop_first() {
-                self.call(&name, event);
+                self.call(name, event);
             }
 
             scheduled.append(&mut future_events);
@@ -8,7 +8,7 @@ use crate::{
             RenderTarget, RenderTargetCollection, RenderTargets, TargetId, TextureTarget,
             WindowTarget,
         },
-        RenderPass, RendererOptions,
+        RenderPass, RenderPasses, RendererOptions,
     },
     resources::{
         mesh::{MeshData, MeshId},
@@ -18,7 +18,10 @@ use crate::{
     sampler::{create_sampler, SamplerOptions},
     scene::Scene,
 };
-use std::sync::{Arc, RwLock, RwLockReadGuard, RwLockWriteGuard};
+use std::{
+    collections::HashMap,
+    sync::{Arc, Mutex, RwLock, RwLockReadGuard, RwLockWriteGuard},
+};
 
 pub type Commands = Vec<wgpu::CommandBuffer>;
 
@@ -44,6 +47,9 @@ pub(crate) struct Renderer {
     pub(crate) queue: wgpu::Queue,
     resources: Arc<RwLock<Resources>>,
     targets: Arc<RwLock<RenderTargets>>,
+    shaders: RwLock<HashMap<&'static str, Arc<wgpu::ShaderModule>>>,
+    samplers: RwLock<HashMap<SamplerOptions, Arc<wgpu::Sampler>>>,
+    passes: Mutex<RenderPasses>,
     pixel: TextureId,
     pass: String, // @TODO support multiple render passes
 }
@@ -142,6 +148,9 @@ impl Renderer {
             pixel,
             targets,
             resources,
+            shaders: RwLock::new(HashMap::new()),
+            samplers: RwLock::new(HashMap::new()),
+            passes: Mutex::new(RenderPasses::default()),
         })
     }
 
@@ -150,6 +159,59 @@ impl Renderer {
         self.pixel
     }
 
+    /// Returns a compiled WGSL Shader Module, compiling it on first use.
+    ///
+    /// Modules are cached by label, so RenderPasses built from the
+    /// same source share one module instead of parsing and validating
+    /// the WGSL code again.
+    pub(crate) fn shader_module(
+        &self,
+        label: &'static str,
+        source: &'static str,
+    ) -> Arc<wgpu::ShaderModule> {
+        if let Ok(shaders) = self.shaders.try_read() {
+            if let Some(module) = shaders.get(label) {
+                return module.clone();
+            }
+        }
+
+        let descriptor = wgpu::ShaderModuleDescriptor {
+            label: Some(label),
+            source: wgpu::ShaderSource::Wgsl(source.into()),
+        };
+        let module = Arc::new(self.device.create_shader_module(descriptor));
+
+        if let Ok(mut shaders) = self.shaders.try_write() {
+            shaders.insert(label, module.clone());
+        } else {
+            log::warn!("Shader cache is locked. Module {} won't be reused.", label);
+        }
+
+        module
+    }
+
+    /// Returns a Sampler with the given options, creating it on first use.
+    ///
+    /// Samplers are immutable and only depend on their options,
+    /// so all Textures with the same options share one Sampler.
+    pub(crate) fn sampler(&self, options: SamplerOptions) -> Arc<wgpu::Sampler> {
+        if let Ok(samplers) = self.samplers.try_read() {
+            if let Some(sampler) = samplers.get(&options) {
+                return sampler.clone();
+            }
+        }
+
+        let sampler = Arc::new(create_sampler(&self.device, options.clone()));
+
+        if let Ok(mut samplers) = self.samplers.try_write() {
+            samplers.insert(options, sampler.clone());
+        } else {
+            log::warn!("Sampler cache is locked. {:?} won't be reused.", options);
+        }
+
+        sampler
+    }
+
     /// Registers a loaded mesh to the Resources Manager.
     ///
     /// This function takes a MeshData instance generated by the MeshBuilder
@@ -246,29 +308,20 @@ impl Renderer {
     ///
     /// Selects a RenderPass to render a frame from the given Scene
     pub(crate) fn render(&self, scene: &Scene) -> Result<(), wgpu::SurfaceError> {
+        let mut passes = if let Ok(passes) = self.passes.try_lock() {
+            passes
+        } else {
+            log::warn!("Dropped Frame: RenderPasses are locked by another frame.");
+            return Err(wgpu::SurfaceError::Lost);
+        };
+
         if self.pass == "solid" {
-            return self.solid_renderpass(scene);
+            // Renders the Solid 3D render pass (for simple 3D primitives)
+            return self.draw(scene, passes.solid(self));
         }
-        self.toy_renderpass(scene)
-    }
-
-    // Renders the Solid 3D render pass (for simple 3D primitives)
-    fn solid_renderpass(&self, scene: &Scene) -> Result<(), wgpu::SurfaceError> {
-        let renderpass = crate::renderer::renderpass::Solid::new(
-            &crate::renderer::renderpass::SolidConfig {
-                cull_back_faces: true,
-            },
-            self,
-        );
-
-        self.draw(scene, renderpass)
-    }
-
-    // Renders the Shadertoy render pass (for a single fullscreen quad)
-    fn toy_renderpass(&self, scene: &Scene) -> Result<(), wgpu::SurfaceError> {
-        let renderpass = crate::renderer::renderpass::Toy::new(self);
 
-        self.draw(scene, renderpass)
+        // Renders the Shadertoy render pass (for a single fullscreen quad)
+        self.draw(scene, passes.toy(self))
     }
 
     // Where the magic happens! 🎨
@@ -277,10 +330,10 @@ impl Renderer {
     fn draw<P: RenderPass>(
         &self,
         scene: &Scene,
-        mut renderpass: P,
+        renderpass: &mut P,
     ) -> Result<(), wgpu::SurfaceError> {
         // Records the render commands in the GPU command buffer
-        let (commands, frames) = renderpass.draw(scene.read_state())?;
+        let (commands, frames) = renderpass.draw(self, scene.read_state())?;
 
         // Runs the commands (submit to GPU queue)
         self.queue.submit(commands);
@@ -467,7 +520,7 @@ impl Internal {
 
         let texture = device.create_texture_with_data(queue, &descriptor, &[0xFF; 4]);
         let view = texture.create_view(&wgpu::TextureViewDescriptor::default());
-        let sampler = create_sampler(
+        let sampler = Arc::new(create_sampler(
             device,
             SamplerOptions {
                 repeat_x: true,
@@ -475,7 +528,7 @@ impl Internal {
                 smooth: false,
                 compare: None,
             },
-        );
+        ));
 
         Ok(Texture {
             id: Texture::id_from(&texture),
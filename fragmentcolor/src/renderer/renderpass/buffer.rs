@@ -8,6 +8,10 @@ pub(super) struct BufferPool {
     pub(super) last_index: usize,
     pub(super) last_offset: u32,
     pub(super) alignment: u32,
+    /// CPU-side copy of each buffer, uploaded in one go by `flush()`.
+    pub(super) staging: Vec<Vec<u8>>,
+    /// Number of bytes written to each staging buffer since the last flush.
+    pub(super) dirty: Vec<u32>,
 }
 
 pub(super) struct BufferLocation {
@@ -32,6 +36,8 @@ impl BufferPool {
             last_offset: 0,
             alignment: device.limits().min_uniform_buffer_offset_alignment,
             usage,
+            staging: vec![vec![0; chunk_size as usize]],
+            dirty: vec![0],
         }
     }
 
@@ -51,6 +57,8 @@ impl BufferPool {
                     usage: self.usage,
                     mapped_at_creation: false,
                 }));
+            self.staging.push(vec![0; self.chunk_size as usize]);
+            self.dirty.push(0);
         }
         buf_count
     }
@@ -64,11 +72,10 @@ impl BufferPool {
         }
     }
 
-    pub(super) fn alloc<T: bytemuck::Pod>(
-        &mut self,
-        object: &T,
-        queue: &wgpu::Queue,
-    ) -> BufferLocation {
+    /// Copies the object into the staging memory of the current buffer.
+    ///
+    /// Nothing is sent to the GPU until `flush()` is called.
+    pub(super) fn alloc<T: bytemuck::Pod>(&mut self, object: &T) -> BufferLocation {
         let size = mem::size_of::<T>() as u32;
         // @FIXME ALL asserts and panics must go away and return a Result
         assert!(size <= self.chunk_size);
@@ -78,12 +85,12 @@ impl BufferPool {
         }
 
         let offset = self.last_offset;
-        let buffer = &self.buffers[self.last_index];
-        queue.write_buffer(
-            buffer,
-            offset as wgpu::BufferAddress,
-            bytemuck::bytes_of(object),
-        );
+        let end = offset + size;
+        self.staging[self.last_index][offset as usize..end as usize]
+            .copy_from_slice(bytemuck::bytes_of(object));
+
+        let dirty = &mut self.dirty[self.last_index];
+        *dirty = (*dirty).max(align_up(end, wgpu::COPY_BUFFER_ALIGNMENT as u32));
 
         self.last_offset = align_up(offset + size, self.alignment);
 
@@ -93,6 +100,18 @@ impl BufferPool {
         }
     }
 
+    /// Uploads everything written since the last flush,
+    /// with a single write per buffer instead of one per object.
+    pub(super) fn flush(&mut self, queue: &wgpu::Queue) {
+        let buffers = self.buffers.iter().zip(&self.staging);
+        for ((buffer, staging), dirty) in buffers.zip(self.dirty.iter_mut()) {
+            if *dirty > 0 {
+                queue.write_buffer(buffer, 0, &staging[..*dirty as usize]);
+                *dirty = 0;
+            }
+        }
+    }
+
     pub(super) fn reset(&mut self) {
         self.last_index = 0;
         self.last_offset = 0;
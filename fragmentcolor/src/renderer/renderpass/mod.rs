@@ -10,7 +10,10 @@ pub(crate) use solid::*;
 pub(crate) use toy::*;
 
 use crate::{
-    renderer::{Commands, RenderedFrames},
+    renderer::{
+        target::IsRenderTarget, Commands, RenderContext, RenderTargetCollection, RenderedFrames,
+        Renderer,
+    },
     scene::SceneState,
 };
 use std::sync::RwLockReadGuard;
@@ -18,5 +21,75 @@ use std::sync::RwLockReadGuard;
 pub(crate) type RenderPassResult = Result<(Commands, RenderedFrames), wgpu::SurfaceError>;
 
 pub(crate) trait RenderPass {
-    fn draw(&mut self, scene: RwLockReadGuard<'_, SceneState>) -> RenderPassResult;
+    fn draw(
+        &mut self,
+        renderer: &Renderer,
+        scene: RwLockReadGuard<'_, SceneState>,
+    ) -> RenderPassResult;
+}
+
+/// The format and sample count of every Render Target,
+/// which must match the color targets of a pipeline.
+type TargetFormats = Vec<(wgpu::TextureFormat, u32)>;
+
+/// Keeps the RenderPasses alive between frames.
+///
+/// Building a RenderPass creates its pipeline, bind group layouts and
+/// uniform buffers, so they are reused until the Render Targets change
+/// in a way that requires a new pipeline.
+#[derive(Default)]
+pub(crate) struct RenderPasses {
+    toy: Option<Toy>,
+    solid: Option<Solid>,
+    target_formats: TargetFormats,
+}
+
+impl std::fmt::Debug for RenderPasses {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.debug_struct("RenderPasses")
+            .field("toy", &self.toy.is_some())
+            .field("solid", &self.solid.is_some())
+            .field("target_formats", &self.target_formats)
+            .finish()
+    }
+}
+
+impl RenderPasses {
+    /// Returns the Shadertoy RenderPass, building it if needed.
+    pub(crate) fn toy(&mut self, renderer: &Renderer) -> &mut Toy {
+        self.invalidate_if_targets_changed(renderer);
+        self.toy.get_or_insert_with(|| Toy::new(renderer))
+    }
+
+    /// Returns the Solid 3D RenderPass, building it if needed.
+    pub(crate) fn solid(&mut self, renderer: &Renderer) -> &mut Solid {
+        self.invalidate_if_targets_changed(renderer);
+        self.solid.get_or_insert_with(|| {
+            Solid::new(
+                &SolidConfig {
+                    cull_back_faces: true,
+                },
+                renderer,
+            )
+        })
+    }
+
+    /// Drops the cached RenderPasses if the Render Targets
+    /// no longer match the ones their pipelines were built for.
+    fn invalidate_if_targets_changed(&mut self, renderer: &Renderer) {
+        let target_formats = if let Ok(targets) = renderer.read_targets() {
+            targets
+                .all()
+                .map(|target| (target.format(), target.sample_count()))
+                .collect::<TargetFormats>()
+        } else {
+            return;
+        };
+
+        if target_formats != self.target_formats {
+            self.toy = None;
+            self.solid = None;
+            self.target_formats = target_formats;
+        }
+    }
 }
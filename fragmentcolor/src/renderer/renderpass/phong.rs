@@ -92,8 +92,7 @@ impl Default for PhongConfig {
     }
 }
 
-pub(crate) struct Phong<'r> {
-    renderer: &'r Renderer,
+pub(crate) struct Phong {
     depth_texture: Option<(wgpu::TextureView, wgpu::Extent3d)>,
     global_uniform_buf: wgpu::Buffer,
     light_buf: wgpu::Buffer,
@@ -107,15 +106,12 @@ pub(crate) struct Phong<'r> {
     temp_lights: Vec<(f32, u32)>,
 }
 
-impl<'r> Phong<'r> {
+impl Phong {
     #[allow(dead_code)]
-    pub(crate) fn new(config: &PhongConfig, renderer: &'r Renderer) -> Self {
+    pub(crate) fn new(config: &PhongConfig, renderer: &Renderer) -> Self {
         let d = renderer.device();
 
-        let shader_module = d.create_shader_module(wgpu::ShaderModuleDescriptor {
-            label: Some("phong"),
-            source: wgpu::ShaderSource::Wgsl(include_str!("phong.wgsl").into()),
-        });
+        let shader_module = renderer.shader_module("phong", include_str!("phong.wgsl"));
 
         let globals_size = mem::size_of::<Globals>() as wgpu::BufferAddress;
         let global_bgl = d.create_bind_group_layout(&wgpu::BindGroupLayoutDescriptor {
@@ -309,7 +305,6 @@ impl<'r> Phong<'r> {
         };
 
         Self {
-            renderer,
             depth_texture: None,
             global_uniform_buf,
             light_capacity: config.max_lights,
@@ -325,18 +320,26 @@ impl<'r> Phong<'r> {
     }
 }
 
-impl<'r> RenderPass for Phong<'r> {
-    fn draw(&mut self, scene: RwLockReadGuard<'_, SceneState>) -> RenderPassResult {
-        let renderer = self.renderer;
+impl RenderPass for Phong {
+    fn draw(
+        &mut self,
+        renderer: &Renderer,
+        scene: RwLockReadGuard<'_, SceneState>,
+    ) -> RenderPassResult {
         let targets = renderer
             .read_targets()
             // @TODO I MEAN IT!!! Remove tech debt (global search "TECH DEBT")
             .expect("TECH DEBT: Avoid panics!!!");
         let device = renderer.device();
 
-        let mut commands = Vec::new();
+        // All cameras and targets are recorded into the same encoder,
+        // so the whole RenderPass ends up in a single command buffer.
+        let mut encoder = device.create_command_encoder(&wgpu::CommandEncoderDescriptor::default());
 
         let mut rendered_frames = Vec::new();
+        // The Scene Tree does not change while we hold the read lock,
+        // so the global transforms are shared by all cameras and targets.
+        let transforms = scene.calculate_global_transforms();
         for (object_id, camera) in scene.cameras().iter() {
             let camera_targets = scene.get_camera_targets(object_id);
 
@@ -375,7 +378,6 @@ impl<'r> RenderPass for Phong<'r> {
                     self.depth_texture = Some((view, target.size().to_wgpu_size()));
                 }
 
-                let transforms = scene.calculate_global_transforms();
                 self.uniform_pool.reset();
                 let queue = renderer.queue();
 
@@ -450,9 +452,6 @@ impl<'r> RenderPass for Phong<'r> {
                     });
                 }
 
-                let mut encoder =
-                    device.create_command_encoder(&wgpu::CommandEncoderDescriptor::default());
-
                 let frame = target.next_frame()?;
 
                 let resources = renderer
@@ -475,7 +474,9 @@ impl<'r> RenderPass for Phong<'r> {
                             view: &self.depth_texture.as_ref().unwrap().0,
                             depth_ops: Some(wgpu::Operations {
                                 load: wgpu::LoadOp::Clear(1.0),
-                                store: wgpu::StoreOp::Store,
+                                // Depth is cleared every frame and never read
+                                // back, so there is no need to write it out.
+                                store: wgpu::StoreOp::Discard,
                             }),
                             stencil_ops: None,
                         }),
@@ -484,6 +485,8 @@ impl<'r> RenderPass for Phong<'r> {
 
                     pass.set_bind_group(0, &self.global_bind_group, &[]);
 
+                    // Consecutive draws of the same mesh keep the buffers bound.
+                    let mut bound_mesh = None;
                     for (_, (entity, &color, &shader)) in scene
                         .query::<(&components::Mesh, &components::Color, &ShaderType)>()
                         .with::<&Vertex<Position>>()
@@ -550,7 +553,7 @@ impl<'r> RenderPass for Phong<'r> {
                             },
                             _pad: [0.0; 3],
                         };
-                        let bl = self.uniform_pool.alloc(&locals, queue);
+                        let bl = self.uniform_pool.alloc(&locals);
 
                         let key = LocalKey {
                             uniform_buf_index: bl.index,
@@ -558,11 +561,17 @@ impl<'r> RenderPass for Phong<'r> {
                         let local_bg = &self.local_bind_groups[&key];
                         pass.set_bind_group(1, local_bg, &[bl.offset]);
 
-                        pass.set_vertex_buffer(0, mesh.vertex_slice::<vertex::Position>());
-                        pass.set_vertex_buffer(1, mesh.vertex_slice::<vertex::Normal>());
+                        let rebind = bound_mesh != Some(entity.mesh_id);
+                        if rebind {
+                            pass.set_vertex_buffer(0, mesh.vertex_slice::<vertex::Position>());
+                            pass.set_vertex_buffer(1, mesh.vertex_slice::<vertex::Normal>());
+                            bound_mesh = Some(entity.mesh_id);
+                        }
 
                         if let Some(ref is) = mesh.vertex_ids {
-                            pass.set_index_buffer(mesh.buffer.slice(is.offset..), is.format);
+                            if rebind {
+                                pass.set_index_buffer(mesh.buffer.slice(is.offset..), is.format);
+                            }
                             pass.draw_indexed(0..is.count, 0, 0..1);
                         } else {
                             pass.draw(0..mesh.vertex_count, 0..1);
@@ -570,13 +579,14 @@ impl<'r> RenderPass for Phong<'r> {
                     }
                 }
 
-                commands.append(&mut vec![encoder.finish()]);
-                target.prepare_render(renderer, &mut commands);
+                target.prepare_render(&mut encoder);
 
                 rendered_frames.push((target.id(), frame));
             }
         }
 
-        Ok((commands, rendered_frames))
+        self.uniform_pool.flush(renderer.queue());
+
+        Ok((vec![encoder.finish()], rendered_frames))
     }
 }
@@ -97,8 +97,7 @@ struct Instance {
 
 /// Realistic renderer.
 /// Follows Disney PBR.
-pub(crate) struct Real<'r> {
-    renderer: &'r Renderer,
+pub(crate) struct Real {
     depth_texture: Option<(wgpu::TextureView, wgpu::Extent3d)>,
     global_uniform_buf: wgpu::Buffer,
     light_buf: wgpu::Buffer,
@@ -112,14 +111,11 @@ pub(crate) struct Real<'r> {
     instances: Vec<Instance>,
 }
 
-impl<'r> Real<'r> {
+impl Real {
     #[allow(dead_code)]
-    pub(crate) fn new(config: &RealConfig, renderer: &'r Renderer) -> Self {
+    pub(crate) fn new(config: &RealConfig, renderer: &Renderer) -> Self {
         let d = renderer.device();
-        let shader_module = d.create_shader_module(wgpu::ShaderModuleDescriptor {
-            label: Some("real"),
-            source: wgpu::ShaderSource::Wgsl(include_str!("real.wgsl").into()),
-        });
+        let shader_module = renderer.shader_module("real", include_str!("real.wgsl"));
 
         let globals_size = mem::size_of::<Globals>() as wgpu::BufferAddress;
         let global_bgl = d.create_bind_group_layout(&wgpu::BindGroupLayoutDescriptor {
@@ -324,7 +320,6 @@ impl<'r> Real<'r> {
         };
 
         Self {
-            renderer,
             depth_texture: None,
             global_uniform_buf,
             light_capacity: config.max_lights,
@@ -340,9 +335,12 @@ impl<'r> Real<'r> {
     }
 }
 
-impl<'r> crate::RenderPass for Real<'r> {
-    fn draw(&mut self, scene: RwLockReadGuard<'_, SceneState>) -> RenderPassResult {
-        let renderer = self.renderer;
+impl crate::RenderPass for Real {
+    fn draw(
+        &mut self,
+        renderer: &Renderer,
+        scene: RwLockReadGuard<'_, SceneState>,
+    ) -> RenderPassResult {
         let targets = renderer
             .read_targets()
             // @TODO I MEAN IT!!! Remove tech debt (global search "TECH DEBT")
@@ -352,9 +350,14 @@ impl<'r> crate::RenderPass for Real<'r> {
             // @TODO I MEAN IT!!! Remove tech debt (global search "TECH DEBT")
             .expect("TECH DEBT: Avoid panics!!!");
         let device = renderer.device();
-        let mut commands = Vec::new();
+        // All cameras and targets are recorded into the same encoder,
+        // so the whole RenderPass ends up in a single command buffer.
+        let mut encoder = device.create_command_encoder(&wgpu::CommandEncoderDescriptor::default());
 
         let mut rendered_frames = Vec::new();
+        // The Scene Tree does not change while we hold the read lock,
+        // so the global transforms are shared by all cameras and targets.
+        let transforms = scene.calculate_global_transforms();
         for (object_id, camera) in scene.cameras().iter() {
             let camera_targets = scene.get_camera_targets(object_id);
 
@@ -394,7 +397,6 @@ impl<'r> crate::RenderPass for Real<'r> {
                     self.depth_texture = Some((view, target.size().to_wgpu_size()));
                 }
 
-                let transforms = scene.calculate_global_transforms();
                 self.uniform_pool.reset();
                 let queue = renderer.queue();
 
@@ -459,7 +461,7 @@ impl<'r> crate::RenderPass for Real<'r> {
                         normal_scale: mat.normal_scale,
                         occlusion_strength: mat.occlusion_strength,
                     };
-                    let locals_bl = self.uniform_pool.alloc(&locals, queue);
+                    let locals_bl = self.uniform_pool.alloc(&locals);
 
                     // pre-create local bind group, if needed
                     let key = LocalKey {
@@ -506,8 +508,6 @@ impl<'r> crate::RenderPass for Real<'r> {
 
                 let frame = target.next_frame()?;
 
-                let mut encoder =
-                    device.create_command_encoder(&wgpu::CommandEncoderDescriptor::default());
                 {
                     let mut pass = encoder.begin_render_pass(&wgpu::RenderPassDescriptor {
                         label: Some("real"),
@@ -523,7 +523,9 @@ impl<'r> crate::RenderPass for Real<'r> {
                             view: &self.depth_texture.as_ref().unwrap().0,
                             depth_ops: Some(wgpu::Operations {
                                 load: wgpu::LoadOp::Clear(1.0),
-                                store: wgpu::StoreOp::Store,
+                                // Depth is cleared every frame and never read
+                                // back, so there is no need to write it out.
+                                store: wgpu::StoreOp::Discard,
                             }),
                             stencil_ops: None,
                         }),
@@ -533,6 +535,8 @@ impl<'r> crate::RenderPass for Real<'r> {
                     pass.set_pipeline(&self.pipelines.main);
                     pass.set_bind_group(0, &self.global_bind_group, &[]);
 
+                    // Consecutive draws of the same mesh keep the buffers bound.
+                    let mut bound_mesh = None;
                     for instance in self.instances.drain(..) {
                         let mesh = if let Some(mesh) = resources.get_mesh(&instance.mesh_id) {
                             mesh
@@ -547,12 +551,18 @@ impl<'r> crate::RenderPass for Real<'r> {
                         let local_bg = &self.local_bind_groups[&key];
                         pass.set_bind_group(1, local_bg, &[instance.locals_bl.offset]);
 
-                        pass.set_vertex_buffer(0, mesh.vertex_slice::<Position>());
-                        pass.set_vertex_buffer(1, mesh.vertex_slice::<TextureCoordinates>());
-                        pass.set_vertex_buffer(2, mesh.vertex_slice::<Normal>());
+                        let rebind = bound_mesh != Some(instance.mesh_id);
+                        if rebind {
+                            pass.set_vertex_buffer(0, mesh.vertex_slice::<Position>());
+                            pass.set_vertex_buffer(1, mesh.vertex_slice::<TextureCoordinates>());
+                            pass.set_vertex_buffer(2, mesh.vertex_slice::<Normal>());
+                            bound_mesh = Some(instance.mesh_id);
+                        }
 
                         if let Some(ref is) = mesh.vertex_ids {
-                            pass.set_index_buffer(mesh.buffer.slice(is.offset..), is.format);
+                            if rebind {
+                                pass.set_index_buffer(mesh.buffer.slice(is.offset..), is.format);
+                            }
                             pass.draw_indexed(0..is.count, 0, 0..1);
                         } else {
                             pass.draw(0..mesh.vertex_count, 0..1);
@@ -560,13 +570,14 @@ impl<'r> crate::RenderPass for Real<'r> {
                     }
                 }
 
-                commands.append(&mut vec![encoder.finish()]);
-                target.prepare_render(renderer, &mut commands);
+                target.prepare_render(&mut encoder);
 
                 rendered_frames.push((target.id(), frame));
             }
         }
 
-        Ok((commands, rendered_frames))
+        self.uniform_pool.flush(renderer.queue());
+
+        Ok((vec![encoder.finish()], rendered_frames))
     }
 }
@@ -48,8 +48,7 @@ impl Default for SolidConfig {
     }
 }
 
-pub(crate) struct Solid<'r> {
-    renderer: &'r Renderer,
+pub(crate) struct Solid {
     depth_texture: Option<(wgpu::TextureView, wgpu::Extent3d)>,
     global_uniform_buf: wgpu::Buffer,
     global_bind_group: wgpu::BindGroup,
@@ -59,13 +58,10 @@ pub(crate) struct Solid<'r> {
     pipeline: wgpu::RenderPipeline,
 }
 
-impl<'r> Solid<'r> {
-    pub(crate) fn new(config: &SolidConfig, renderer: &'r Renderer) -> Self {
+impl Solid {
+    pub(crate) fn new(config: &SolidConfig, renderer: &Renderer) -> Self {
         let d = renderer.device();
-        let shader_module = d.create_shader_module(wgpu::ShaderModuleDescriptor {
-            label: Some("solid"),
-            source: wgpu::ShaderSource::Wgsl(include_str!("solid.wgsl").into()),
-        });
+        let shader_module = renderer.shader_module("solid", include_str!("solid.wgsl"));
 
         let globals_size = mem::size_of::<Globals>() as wgpu::BufferAddress;
         let global_bgl = d.create_bind_group_layout(&wgpu::BindGroupLayoutDescriptor {
@@ -164,7 +160,6 @@ impl<'r> Solid<'r> {
         });
 
         Self {
-            renderer,
             depth_texture: None,
             global_uniform_buf,
             global_bind_group,
@@ -176,9 +171,12 @@ impl<'r> Solid<'r> {
     }
 }
 
-impl<'r> RenderPass for Solid<'r> {
-    fn draw(&mut self, scene: RwLockReadGuard<'_, SceneState>) -> RenderPassResult {
-        let renderer = self.renderer;
+impl RenderPass for Solid {
+    fn draw(
+        &mut self,
+        renderer: &Renderer,
+        scene: RwLockReadGuard<'_, SceneState>,
+    ) -> RenderPassResult {
         let device = renderer.device();
         let resources = renderer
             .read_resources()
@@ -191,9 +189,14 @@ impl<'r> RenderPass for Solid<'r> {
 
         // @TODO!
 
-        let mut commands = Vec::new();
+        // All cameras and targets are recorded into the same encoder,
+        // so the whole RenderPass ends up in a single command buffer.
+        let mut encoder = device.create_command_encoder(&wgpu::CommandEncoderDescriptor::default());
 
         let mut rendered_frames = Vec::new();
+        // The Scene Tree does not change while we hold the read lock,
+        // so the global transforms are shared by all cameras and targets.
+        let transforms = scene.calculate_global_transforms();
         for (object_id, camera) in scene.cameras().iter() {
             let camera_targets = scene.get_camera_targets(object_id);
 
@@ -234,7 +237,6 @@ impl<'r> RenderPass for Solid<'r> {
                     self.depth_texture = Some((view, target.size().to_wgpu_size()));
                 }
 
-                let transforms = scene.calculate_global_transforms();
                 self.uniform_pool.reset();
                 let queue = renderer.queue();
 
@@ -278,9 +280,6 @@ impl<'r> RenderPass for Solid<'r> {
 
                 let frame = target.next_frame()?;
 
-                let mut encoder =
-                    device.create_command_encoder(&wgpu::CommandEncoderDescriptor::default());
-
                 {
                     let mut pass = encoder.begin_render_pass(&wgpu::RenderPassDescriptor {
                         label: Some("solid"),
@@ -301,7 +300,9 @@ impl<'r> RenderPass for Solid<'r> {
                             view: &self.depth_texture.as_ref().unwrap().0,
                             depth_ops: Some(wgpu::Operations {
                                 load: wgpu::LoadOp::Clear(1.0),
-                                store: wgpu::StoreOp::Store,
+                                // Depth is cleared every frame and never read
+                                // back, so there is no need to write it out.
+                                store: wgpu::StoreOp::Discard,
                             }),
                             stencil_ops: None,
                         }),
@@ -310,6 +311,8 @@ impl<'r> RenderPass for Solid<'r> {
                     pass.set_pipeline(&self.pipeline);
                     pass.set_bind_group(0, &self.global_bind_group, &[]);
 
+                    // Consecutive draws of the same mesh keep the buffers bound.
+                    let mut bound_mesh = None;
                     for (_, (entity, color)) in scene
                         .query::<(&crate::Mesh, &crate::Color)>()
                         .with::<&Vertex<Position>>()
@@ -322,7 +325,7 @@ impl<'r> RenderPass for Solid<'r> {
                             rotation: local.rotation,
                             color: color.into_vec4_gamma(),
                         };
-                        let bl = self.uniform_pool.alloc(&locals, queue);
+                        let bl = self.uniform_pool.alloc(&locals);
 
                         let key = LocalKey {
                             uniform_buf_index: bl.index,
@@ -335,11 +338,20 @@ impl<'r> RenderPass for Solid<'r> {
                         } else {
                             continue;
                         };
-                        let position_vertices = mesh.vertex_data::<Position>().unwrap();
-                        pass.set_vertex_buffer(0, mesh.buffer.slice(position_vertices.offset..));
+                        let rebind = bound_mesh != Some(entity.mesh_id);
+                        if rebind {
+                            let position_vertices = mesh.vertex_data::<Position>().unwrap();
+                            pass.set_vertex_buffer(
+                                0,
+                                mesh.buffer.slice(position_vertices.offset..),
+                            );
+                            bound_mesh = Some(entity.mesh_id);
+                        }
 
                         if let Some(ref is) = mesh.vertex_ids {
-                            pass.set_index_buffer(mesh.buffer.slice(is.offset..), is.format);
+                            if rebind {
+                                pass.set_index_buffer(mesh.buffer.slice(is.offset..), is.format);
+                            }
                             pass.draw_indexed(0..is.count, 0, 0..1);
                         } else {
                             pass.draw(0..mesh.vertex_count, 0..1);
@@ -347,13 +359,14 @@ impl<'r> RenderPass for Solid<'r> {
                     }
                 }
 
-                commands.append(&mut vec![encoder.finish()]);
-                target.prepare_render(renderer, &mut commands);
+                target.prepare_render(&mut encoder);
 
                 rendered_frames.push((target.id(), frame));
             }
         }
 
-        Ok((commands, rendered_frames))
+        self.uniform_pool.flush(renderer.queue());
+
+        Ok((vec![encoder.finish()], rendered_frames))
     }
 }
@@ -64,10 +64,13 @@ struct Instance {
     image: crate::TextureId,
 }
 
-pub(crate) struct Toy<'r> {
-    renderer: &'r Renderer,
+pub(crate) struct Toy {
     window_uniform_buffer: wgpu::Buffer,
     globals_uniform_buffer: wgpu::Buffer,
+    // Last values written to the buffers above, so that
+    // unchanged uniforms are not uploaded again every frame.
+    window_uniforms: Option<WindowUniforms>,
+    globals: Option<Globals>,
     globals_bind_group: wgpu::BindGroup,
     locals_bind_group_layout: wgpu::BindGroupLayout,
     locals_bind_groups: fxhash::FxHashMap<LocalKey, wgpu::BindGroup>,
@@ -76,14 +79,12 @@ pub(crate) struct Toy<'r> {
     temp: Vec<Instance>,
 }
 
-impl<'r> Toy<'r> {
-    pub(crate) fn new(renderer: &'r Renderer) -> Self {
+impl Toy {
+    pub(crate) fn new(renderer: &Renderer) -> Self {
         let device = renderer.device();
 
-        let shader_module = device.create_shader_module(wgpu::ShaderModuleDescriptor {
-            label: Some("Toy Renderpass: Shader Module"),
-            source: wgpu::ShaderSource::Wgsl(include_str!("toy.wgsl").into()),
-        });
+        let shader_module =
+            renderer.shader_module("Toy Renderpass: Shader Module", include_str!("toy.wgsl"));
 
         // @TODO When we implement shader composition, this should be
         //       shared between all RenderPasses so we don't need to
@@ -253,9 +254,10 @@ impl<'r> Toy<'r> {
         };
 
         Self {
-            renderer,
             window_uniform_buffer,
             globals_uniform_buffer,
+            window_uniforms: None,
+            globals: None,
             globals_bind_group,
             locals_bind_groups: Default::default(),
             locals_bind_group_layout: local_bgl,
@@ -266,10 +268,13 @@ impl<'r> Toy<'r> {
     }
 }
 
-impl<'r> RenderPass for Toy<'r> {
-    fn draw(&mut self, scene: RwLockReadGuard<'_, SceneState>) -> RenderPassResult {
+impl RenderPass for Toy {
+    fn draw(
+        &mut self,
+        renderer: &Renderer,
+        scene: RwLockReadGuard<'_, SceneState>,
+    ) -> RenderPassResult {
         self.uniform_pool.reset();
-        let renderer = self.renderer;
         let targets = renderer
             .read_targets()
             // @TODO I MEAN IT!!! Remove tech debt (global search "TECH DEBT")
@@ -279,7 +284,17 @@ impl<'r> RenderPass for Toy<'r> {
 
         let transforms = scene.calculate_global_transforms();
 
-        let mut commands = Vec::new();
+        // The bind groups outlive a frame, so the ones pointing to
+        // textures removed from the Resources must be dropped here,
+        // otherwise they keep the GPU textures alive forever.
+        if let Ok(resources) = renderer.read_resources() {
+            self.locals_bind_groups
+                .retain(|key, _| resources.get_texture(&key.image).is_some());
+        }
+
+        // All cameras and targets are recorded into the same encoder,
+        // so the whole RenderPass ends up in a single command buffer.
+        let mut encoder = device.create_command_encoder(&wgpu::CommandEncoderDescriptor::default());
         let mut frames_to_render = Vec::new();
         let mut rendered_frames = Vec::new();
 
@@ -329,11 +344,14 @@ impl<'r> RenderPass for Toy<'r> {
                     log::info!("Window Uniform: {:?}", window_uniforms);
                     log::info!("");
 
-                    queue.write_buffer(
-                        &self.window_uniform_buffer,
-                        0,
-                        bytemuck::bytes_of(&window_uniforms),
-                    );
+                    if changed(&self.window_uniforms, &window_uniforms) {
+                        queue.write_buffer(
+                            &self.window_uniform_buffer,
+                            0,
+                            bytemuck::bytes_of(&window_uniforms),
+                        );
+                        self.window_uniforms = Some(window_uniforms);
+                    }
 
                     let globals = Globals {
                         view_proj: final_m.to_cols_array_2d(),
@@ -344,11 +362,14 @@ impl<'r> RenderPass for Toy<'r> {
                         log::info!("{:?}", row);
                     }
                     log::info!("");
-                    queue.write_buffer(
-                        &self.globals_uniform_buffer,
-                        0,
-                        bytemuck::bytes_of(&globals),
-                    );
+                    if changed(&self.globals, &globals) {
+                        queue.write_buffer(
+                            &self.globals_uniform_buffer,
+                            0,
+                            bytemuck::bytes_of(&globals),
+                        );
+                        self.globals = Some(globals);
+                    }
                 }
 
                 self.temp.clear();
@@ -430,7 +451,7 @@ impl<'r> RenderPass for Toy<'r> {
                     log::info!("Locals Uniform: {:?}", locals);
                     log::info!("");
 
-                    let locals_bl = self.uniform_pool.alloc(&locals, queue);
+                    let locals_bl = self.uniform_pool.alloc(&locals);
                     let local_bgl = &self.locals_bind_group_layout;
 
                     // pre-create local bind group, if needed
@@ -490,9 +511,6 @@ impl<'r> RenderPass for Toy<'r> {
                 })
                 .collect::<Vec<_>>();
 
-            let mut encoder =
-                device.create_command_encoder(&wgpu::CommandEncoderDescriptor::default());
-
             // @TODO this is the core of what the RenderPass does, and it only needs a Frame
             //       from a specific target. The RenderPass trait abstraction for multiple targets
             //       is wrong, I should go back to the older method or craate a second trait for a single target.
@@ -519,14 +537,23 @@ impl<'r> RenderPass for Toy<'r> {
                 }
             }
 
-            commands.append(&mut vec![encoder.finish()]);
-
             for (target, frame, _) in frames_to_render.drain(..) {
-                target.prepare_render(renderer, &mut commands);
+                target.prepare_render(&mut encoder);
                 rendered_frames.push((target.id(), frame));
             }
         }
 
-        Ok((commands, rendered_frames))
+        self.uniform_pool.flush(renderer.queue());
+
+        Ok((vec![encoder.finish()], rendered_frames))
+    }
+}
+
+/// Compares uniforms byte by byte, so that float fields
+/// don't need to implement PartialEq.
+fn changed<T: bytemuck::Pod>(previous: &Option<T>, current: &T) -> bool {
+    match previous {
+        Some(previous) => bytemuck::bytes_of(previous) != bytemuck::bytes_of(current),
+        None => true,
     }
 }
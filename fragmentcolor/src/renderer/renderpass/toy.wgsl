@@ -64,93 +64,32 @@ fn main_vs(@builtin(vertex_index) vertex_index: u32) -> VertexOutput {
     let texture_uv = vec2<f32>(x, y);
 
     // SDF flag 0.0 means this object is a textured Sprite.
-    // Otherwise, it's a calculated shape from a SDF function.
-    if object.sdf_flags == 1.0 {
-        
-        // Sprite's X and Y position in pixels
-        let sprite_position = object.position;
-
-        // Normalizes the sprite's position and size
-        let clip_position = (globals.view_projection * sprite_position);
-
-        var scale: vec2<f32>;
-        let texture_aspect = object.texture_uv.z / object.texture_uv.w;
-        let window_aspect = window.resolution.x / window.resolution.y;
-
-        //@TODO Make this Configurable
-
-        // Full Image
-        if texture_aspect > window_aspect {
-            scale = vec2<f32>(1.0, window_aspect / texture_aspect);
-        } else {
-            scale = vec2<f32>(texture_aspect / window_aspect, 1.0);
-        };
-
-        // Fullscreen
-        // if texture_aspect > window_aspect {
-        //     scale = vec2<f32>(window_aspect / texture_aspect, 1.0);
-        // } else {
-        //     scale = vec2<f32>(1.0, texture_aspect / window_aspect);
-        // }
-
-        // the full size of the Sprite's texture in pixels
-        let texture_size = object.texture_uv.zw;
-
-        // Sprite's clip region in pixels. Defines the sprite's
-        // size and the section of the texture it will display
-        let sprite_clip_origin = object.bounds.xy;
-        let sprite_clip_size = object.bounds.zw;
-
-        // Normalizes Texture's UV coordinates for the clip region
-        let texture_uv_min = sprite_clip_origin / texture_size;
-        let texture_uv_max = (sprite_clip_origin + sprite_clip_size) / texture_size;
-        let adjusted_uv = mix(texture_uv_min, texture_uv_max, texture_uv);
-
-        let flipped_uv = adjusted_uv * vec2<f32>(1.0, -1.0) + vec2<f32>(0.0, 1.0);
-
-        // adjusted_uv.x - 1.0 (left of the screen: sprite renders fully)
-        // adjusted_uv.y + 0.0 (center of the screen)
-        // adjusted_uv.x + 1.0 (right of the screen: sprite gets clipped out and disappears)
-
-        // adjusted_uv.y + 0.0 (top of the screen)
-
-        // Adjust vertex positions
-        let tx = texture_uv.x * 2.0 - 1.0;
-        let ty = texture_uv.y * 2.0 - 1.0;
-
-        let ndc = vec2<f32>(2.0 * texture_uv - vec2<f32>(1.0, 1.0));
-        let out = vec4<f32>(ndc, 0.0, 1.0);
-
-        //let out = vec2<f32>(tx, ty) * scale;
+    // Flags 1.0 to 3.0 are shapes calculated from a SDF function,
+    // and anything else is a Shadertoy-compatible shader.
+    if object.sdf_flags >= 1.0 && object.sdf_flags <= 3.0 {
+
+        // The SDF shapes are evaluated in pixel coordinates by the
+        // fragment shader, so their quad only needs to cover their
+        // bounds (plus border and antialiasing) instead of the full
+        // screen. This avoids shading fragments that are never visible.
+        let margin = object.border + window.antialiaser;
+        let half_size = max(object.bounds.zw, vec2<f32>(object.radius)) + vec2<f32>(margin);
+
+        // The vertex coordinates above span [0, 2], so the quad
+        // corners go from -1 to +1 times the shape's half size.
+        // Pixels have their origin at the top-left of the target.
+        let corner = texture_uv - vec2<f32>(1.0, 1.0);
+        let pixel = object.position.xy + corner * half_size;
+
+        // Converts from pixels to Normalized Device Coordinates
+        let ndc = vec2<f32>(
+            2.0 * pixel.x / window.resolution.x - 1.0,
+            1.0 - 2.0 * pixel.y / window.resolution.y
+        );
 
-        // Fullscreen but stretched
-        // let out = 2.0 * texture_uv - vec2<f32>(1.0, 1.0);
         return VertexOutput(
-            //
-            // from: https://gpuweb.github.io/gpuweb/#clip-volume
-            //
-            // 23.3.4. Primitive Clipping 
-            // Vertex shaders have to produce a built-in position (of type vec4<f32>), 
-            // which denotes the clip position of a vertex in clip space coordinates.
-            //
-            // Clip space coordinates have four dimensions: (x, y, z, w)
-            //
-            // - Clip space coordinates are used for the the clip position of a vertex
-            //   (i.e. the position output of a vertex shader), and for the clip volume.
-            // 
-            // - Normalized device coordinates and clip space coordinates are related as follows: 
-            //
-            //      If the clip volume is  p = (p.x,         p.y,         p.z,         p.w),
-            //           then its NDC are      (p.x ÷ p.w,   p.y ÷ p.w,   p.z ÷ p.w).
-
-            // vec4<f32>(adjusted_uv.x, adjusted_uv.y, 0.0, 1.0),
-            vec4<f32>(out.xy * scale, 0.0, 1.0),
-
-            // UV coordinates are used to sample textures, and have two dimensions (u, v):
-            //  -  Both range from 0.0 to 1.0.
-            //  -  (0.0, 0.0) is in the first texel in texture memory address order.
-            //  -  (1.0, 1.0) is in the last texel texture memory address order.
-            vec2<f32>(flipped_uv.x, flipped_uv.y)
+            vec4<f32>(ndc, 0.0, 1.0),
+            texture_uv * vec2<f32>(0.5, -0.5) + vec2<f32>(0.0, 1.0)
         );
     } else {
         // builds a fullscreen quad compatible with Shadertoy
@@ -170,11 +109,10 @@ fn main_fs(in: VertexOutput) -> @location(0) vec4<f32> {
         let texture_color = textureSample(texture, texture_sampler, in.texture_coord);
 
         // CLAMP_TO_BORDER is not supported in legacy WebGL
-        // we have to do it here
-        var alpha = 1.0;
-        if in.texture_coord.x > 1.0 || in.texture_coord.y > 1.0 || in.texture_coord.x < 0.0 || in.texture_coord.y < 0.0 {
-            alpha = 0.0;
-        }
+        // we have to do it here. The mask is branchless:
+        // 1.0 inside the [0, 1] UV range, 0.0 outside.
+        let inside = step(vec2<f32>(0.0), in.texture_coord) * step(in.texture_coord, vec2<f32>(1.0));
+        let alpha = inside.x * inside.y;
 
         // Premultiply the texture's Alpha
         return texture_color * vec4<f32>(texture_color.aaa, alpha);
@@ -4,7 +4,7 @@ use crate::{
     components,
     components::Camera,
     math::geometry::Quad,
-    renderer::{Commands, Renderer},
+    renderer::Renderer,
     resources::{
         buffer::{Buffer, BufferSize, TextureBuffer},
         texture::{Texture, TextureId},
@@ -12,7 +12,6 @@ use crate::{
     scene::{Object, ObjectId},
     FragmentColor, SceneObject,
 };
-use image::Rgba;
 use std::{
     collections::{
         hash_map::{Values, ValuesMut},
@@ -46,7 +45,7 @@ pub(crate) trait IsRenderTarget: Debug + 'static + Dimensions {
     fn sample_count(&self) -> u32;
     fn resize(&mut self, renderer: &Renderer, size: wgpu::Extent3d) -> Result<(), Error>;
     fn next_frame(&self) -> Result<Frame, wgpu::SurfaceError>;
-    fn prepare_render(&self, renderer: &Renderer, commands: &mut Commands);
+    fn prepare_render(&self, encoder: &mut wgpu::CommandEncoder);
     fn present(&mut self, frame: Frame);
 }
 
@@ -334,6 +333,12 @@ impl IsRenderTarget for RenderTarget {
     }
 
     fn resize(&mut self, renderer: &Renderer, size: wgpu::Extent3d) -> Result<(), Error> {
+        // Reconfiguring a surface or reallocating a texture is expensive,
+        // and resize events often repeat the size the target already has.
+        if self.size().to_wgpu_size() == size {
+            return Ok(());
+        }
+
         match self {
             Self::Texture(_) => {
                 let new_target = TextureTarget::new(renderer, size)?;
@@ -362,9 +367,11 @@ impl IsRenderTarget for RenderTarget {
         }
     }
 
-    fn prepare_render(&self, renderer: &Renderer, commands: &mut Commands) {
+    /// Records any commands the target needs after its frame is drawn
+    /// (i.e. the texture readback copy) in the same command encoder.
+    fn prepare_render(&self, encoder: &mut wgpu::CommandEncoder) {
         if let RenderTarget::Texture(target) = self {
-            target.copy_texture_to_buffer(renderer, commands)
+            target.copy_texture_to_buffer(encoder)
         }
     }
 
@@ -442,14 +449,8 @@ impl TextureTarget {
         Ok(())
     }
 
-    fn copy_texture_to_buffer(&self, renderer: &Renderer, commands: &mut Commands) {
+    fn copy_texture_to_buffer(&self, encoder: &mut wgpu::CommandEncoder) {
         if let Some(TextureBuffer { inner, clip_region }) = &self.buffer {
-            let mut encoder =
-                renderer
-                    .device
-                    .create_command_encoder(&wgpu::CommandEncoderDescriptor {
-                        label: Some("Render target transfer encoder"),
-                    });
             let Buffer { buffer, size } = inner;
 
             encoder.copy_texture_to_buffer(
@@ -480,19 +481,32 @@ impl TextureTarget {
                     depth_or_array_layers: 1,
                 },
             );
-
-            commands.append(&mut vec![encoder.finish()])
         }
     }
 
     // @TODO TECH DEBT call this at some point.
     #[allow(dead_code)]
     pub async fn get_rendered_frame_bytes(&self, renderer: &Renderer) -> Result<Vec<u8>, Error> {
+        let mut bytes = Vec::new();
+        self.read_rendered_frame_into(renderer, &mut bytes).await?;
+
+        Ok(bytes)
+    }
+
+    /// Reads the last rendered frame into the given buffer.
+    ///
+    /// The buffer is cleared and refilled, so callers that read frames
+    /// repeatedly can keep reusing the same allocation.
+    pub async fn read_rendered_frame_into(
+        &self,
+        renderer: &Renderer,
+        bytes: &mut Vec<u8>,
+    ) -> Result<(), Error> {
         if let Some(texture_buffer) = &self.buffer {
             let output_buffer = &texture_buffer.inner.buffer;
 
             // We need to scope the mapping variables so that we can unmap the buffer
-            let rendered_image = {
+            {
                 let buffer_slice = output_buffer.slice(..);
 
                 // NOTE: We have to create the mapping THEN device.poll()
@@ -515,19 +529,17 @@ impl TextureTarget {
                     return Err("Failed to read texture buffer".into());
                 };
 
-                let buffer = image::ImageBuffer::<Rgba<u8>, _>::from_raw(
-                    self.texture.size.width,
-                    self.texture.size.height,
-                    output_buffer_data,
-                )
-                .unwrap();
-
-                buffer.to_vec()
-            };
+                // Strips the row padding required by wgpu's copy alignment,
+                // copying each row once into the caller's buffer.
+                texture_buffer
+                    .inner
+                    .size
+                    .unpad_rows_into(&output_buffer_data, bytes);
+            }
 
             output_buffer.unmap();
 
-            Ok(rendered_image)
+            Ok(())
         } else {
             Err("No texture buffer available to copy from".into())
         }
@@ -14,9 +14,9 @@ impl BufferSize {
     pub fn new(width: usize, height: usize) -> Self {
         let bytes_per_pixel = size_of::<u32>();
         let unpadded_bytes_per_row = width * bytes_per_pixel;
+        // The row alignment is a power of two, so rounding up is a simple mask.
         let align = wgpu::COPY_BYTES_PER_ROW_ALIGNMENT as usize;
-        let padded_bytes_per_row_padding = (align - unpadded_bytes_per_row % align) % align;
-        let padded_bytes_per_row = (unpadded_bytes_per_row + padded_bytes_per_row_padding) as u32;
+        let padded_bytes_per_row = ((unpadded_bytes_per_row + align - 1) & !(align - 1)) as u32;
 
         Self {
             width,
@@ -29,6 +29,18 @@ impl BufferSize {
     pub fn size(&self) -> u64 {
         self.padded_bytes_per_row as u64 * self.height as u64
     }
+
+    /// Copies the rows of a padded readback buffer into `bytes`,
+    /// dropping the padding wgpu adds to satisfy its copy alignment.
+    ///
+    /// The buffer is cleared first, so it can be reused between reads.
+    pub fn unpad_rows_into(&self, padded: &[u8], bytes: &mut Vec<u8>) {
+        bytes.clear();
+        bytes.reserve(self.unpadded_bytes_per_row * self.height);
+        for row in padded.chunks_exact(self.padded_bytes_per_row as usize) {
+            bytes.extend_from_slice(&row[..self.unpadded_bytes_per_row]);
+        }
+    }
 }
 
 #[derive(Debug)]
@@ -42,3 +54,44 @@ pub struct TextureBuffer {
     pub inner: Buffer,
     pub clip_region: Quad,
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_buffer_size_pads_rows_to_copy_alignment() {
+        let align = wgpu::COPY_BYTES_PER_ROW_ALIGNMENT;
+
+        let aligned = BufferSize::new(64, 2);
+        assert_eq!(aligned.unpadded_bytes_per_row, 256);
+        assert_eq!(aligned.padded_bytes_per_row, align);
+        assert_eq!(aligned.size(), 2 * align as u64);
+
+        let unaligned = BufferSize::new(65, 3);
+        assert_eq!(unaligned.unpadded_bytes_per_row, 260);
+        assert_eq!(unaligned.padded_bytes_per_row, 2 * align);
+        assert_eq!(unaligned.size(), 3 * 2 * align as u64);
+    }
+
+    #[test]
+    fn test_unpad_rows_drops_row_padding() {
+        let size = BufferSize::new(3, 2);
+        let padded_row = size.padded_bytes_per_row as usize;
+        let unpadded_row = size.unpadded_bytes_per_row;
+        assert_ne!(padded_row, unpadded_row);
+
+        // Each row is filled with its index, and the padding with 0xff
+        let mut padded = vec![0xff; padded_row * size.height];
+        for (y, row) in padded.chunks_exact_mut(padded_row).enumerate() {
+            row[..unpadded_row].fill(y as u8);
+        }
+
+        let mut bytes = vec![42; 5];
+        size.unpad_rows_into(&padded, &mut bytes);
+
+        let mut expected = vec![0; unpadded_row];
+        expected.extend(vec![1; unpadded_row]);
+        assert_eq!(bytes, expected);
+    }
+}
@@ -167,7 +167,9 @@ impl MeshBuilder {
             return Err("Renderer is locked. Cannot build Mesh!!".into());
         };
 
-        let mut usage = wgpu::BufferUsages::COPY_DST | wgpu::BufferUsages::VERTEX;
+        // Mesh data is immutable once built, so the buffer is only
+        // ever read by the GPU and does not need to be a copy target.
+        let mut usage = wgpu::BufferUsages::VERTEX;
         usage.set(wgpu::BufferUsages::INDEX, self.vertex_ids.is_some());
         let buffer = renderer
             .device
@@ -1,4 +1,4 @@
-#[derive(Debug, Clone)]
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
 pub(crate) struct SamplerOptions {
     pub repeat_x: bool,
     pub repeat_y: bool,
@@ -17,10 +17,6 @@ impl Default for SamplerOptions {
     }
 }
 
-pub(crate) fn create_default_sampler(device: &wgpu::Device) -> wgpu::Sampler {
-    create_sampler(device, SamplerOptions::default())
-}
-
 pub(crate) fn create_sampler(device: &wgpu::Device, options: SamplerOptions) -> wgpu::Sampler {
     let label = format!("{:?}", options);
     let address_mode_u = match options.repeat_x {
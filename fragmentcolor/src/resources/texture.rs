@@ -1,11 +1,11 @@
 use crate::{
     app,
     renderer::{target::Dimensions, Renderer},
-    resources::sampler::{create_default_sampler, create_sampler, SamplerOptions},
+    resources::sampler::SamplerOptions,
     FragmentColor, Quad,
 };
 use image::{DynamicImage, GenericImageView};
-use std::path::Path;
+use std::{path::Path, sync::Arc};
 
 type Error = Box<dyn std::error::Error>;
 
@@ -35,7 +35,7 @@ pub struct Texture {
     pub size: wgpu::Extent3d,
     pub view: wgpu::TextureView,
     pub format: wgpu::TextureFormat,
-    pub sampler: wgpu::Sampler,
+    pub sampler: Arc<wgpu::Sampler>,
 }
 
 impl Dimensions for Texture {
@@ -66,7 +66,7 @@ impl Texture {
     pub fn from_file(path: impl AsRef<Path>) -> Result<(TextureId, Quad), Error> {
         let image = image::open(path)?;
         let size = image.dimensions();
-        let texture_id = Self::from_loaded_image(&image)?;
+        let texture_id = Self::from_loaded_image(image)?;
 
         Ok((texture_id, Quad::from_tuple(size)))
     }
@@ -78,7 +78,7 @@ impl Texture {
     pub fn from_bytes(bytes: &[u8]) -> Result<(TextureId, Quad), Error> {
         let image = image::load_from_memory(bytes)?;
         let size = image.dimensions();
-        let texture_id = Self::from_loaded_image(&image)?;
+        let texture_id = Self::from_loaded_image(image)?;
 
         Ok((texture_id, Quad::from_tuple(size)))
     }
@@ -103,7 +103,7 @@ impl Texture {
         let descriptor = Self::target_texture_descriptor(label, size, format);
         let texture = renderer.device.create_texture(&descriptor);
         let view = texture.create_view(&wgpu::TextureViewDescriptor::default());
-        let sampler = create_default_sampler(&renderer.device);
+        let sampler = renderer.sampler(SamplerOptions::default());
 
         Ok(Self {
             id: TextureId(texture.global_id()),
@@ -134,15 +134,12 @@ impl Texture {
         let descriptor = Self::source_texture_descriptor(label, size, format);
         let texture = renderer.device.create_texture(&descriptor);
         let view = texture.create_view(&wgpu::TextureViewDescriptor::default());
-        let sampler = create_sampler(
-            &renderer.device,
-            SamplerOptions {
-                repeat_x: false,
-                repeat_y: false,
-                smooth: true,
-                compare: Some(wgpu::CompareFunction::LessEqual),
-            },
-        );
+        let sampler = renderer.sampler(SamplerOptions {
+            repeat_x: false,
+            repeat_y: false,
+            smooth: true,
+            compare: Some(wgpu::CompareFunction::LessEqual),
+        });
 
         let texture = Self {
             id: TextureId(texture.global_id()),
@@ -178,7 +175,7 @@ impl Texture {
         let descriptor = Self::source_texture_descriptor("Default Blank Pixel", size, format);
         let texture = renderer.device.create_texture(&descriptor);
         let view = texture.create_view(&wgpu::TextureViewDescriptor::default());
-        let sampler = create_default_sampler(&renderer.device);
+        let sampler = renderer.sampler(SamplerOptions::default());
 
         let texture = Self {
             id: TextureId(texture.global_id()),
@@ -204,8 +201,9 @@ impl Texture {
 
     /// Internal method to create a TextureId from a DynamicImage instance.
     ///
-    /// The image is already loaded in memory at this point.
-    fn from_loaded_image(image: &DynamicImage) -> Result<TextureId, Error> {
+    /// The image is already loaded in memory at this point. It is taken
+    /// by value so RGBA8 images can be uploaded without an extra copy.
+    fn from_loaded_image(image: DynamicImage) -> Result<TextureId, Error> {
         let label = "Source texture";
         let (width, height) = image.dimensions();
         let size = wgpu::Extent3d {
@@ -225,11 +223,11 @@ impl Texture {
 
         let texture = renderer.device.create_texture(&descriptor);
 
-        let source = image.to_rgba8();
+        let source = image.into_rgba8();
         Self::write_data_to_texture(&renderer, source, &texture, size);
 
         let view = texture.create_view(&wgpu::TextureViewDescriptor::default());
-        let sampler = create_default_sampler(&renderer.device);
+        let sampler = renderer.sampler(SamplerOptions::default());
 
         let texture = Self {
             id: TextureId(texture.global_id()),
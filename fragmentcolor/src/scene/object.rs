@@ -401,7 +401,17 @@ impl<T: APIObject> Object<T> {
     /// This method simply overwrites the current position data.
     pub fn set_position<V: Into<Vec2or3>>(&mut self, position: V) -> &mut Self {
         let position: Vec3 = position.into().into();
-        self.transform.local.position = position.into();
+        let position: glam::Vec3 = position.into();
+
+        // Setting the same position every frame is common in draw
+        // callbacks, so we avoid locking the Scene for writing when
+        // nothing changed. The Scene's copy is checked too, because
+        // an earlier write may have been dropped on lock contention.
+        if self.transform.local.position == position && self.is_transform_in_scene() {
+            return self;
+        }
+
+        self.transform.local.position = position;
         self.update_transform()
     }
 
@@ -755,6 +765,24 @@ impl<T: APIObject> Object<T> {
         };
     }
 
+    /// Whether the Scene's Transform is up to date with this Object.
+    ///
+    /// Objects in batch mode or outside a Scene have nothing to update.
+    fn is_transform_in_scene(&self) -> bool {
+        if self.batch {
+            return true;
+        }
+        if let Some(scene) = self.scene.clone() {
+            if let Ok(scene) = scene.try_read() {
+                scene.read_transform(self.transform_id) == Some(self.transform)
+            } else {
+                false
+            }
+        } else {
+            true
+        }
+    }
+
     /// Reads the Scene's Transform associated with this Object.
     fn read_transform_from_scene(&self) -> Option<Transform> {
         if let Some(scene) = self.scene.clone() {
@@ -840,3 +868,46 @@ impl<T: APIObject> Object<T> {
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::{
+        components::{Circle, CircleOptions},
+        Scene,
+    };
+
+    fn scene_position(object: &impl SceneObject) -> glam::Vec3 {
+        object.transform().local.position
+    }
+
+    #[test]
+    fn test_set_position_updates_scene_transform() {
+        let mut scene = Scene::new_unregistered();
+        let mut shape = Circle::new(CircleOptions::default());
+        scene.add(&mut shape);
+
+        shape.set_position((0.5, 0.25));
+        assert_eq!(scene_position(&shape), glam::Vec3::new(0.5, 0.25, 0.0));
+
+        // Setting the same position again is a no-op
+        shape.set_position((0.5, 0.25));
+        assert_eq!(scene_position(&shape), glam::Vec3::new(0.5, 0.25, 0.0));
+    }
+
+    #[test]
+    fn test_set_same_position_repairs_dropped_write() {
+        let mut scene = Scene::new_unregistered();
+        let mut shape = Circle::new(CircleOptions::default());
+        scene.add(&mut shape);
+
+        // The write is dropped while the Scene State is locked
+        let state = scene.read_state();
+        shape.set_position((0.5, 0.25));
+        drop(state);
+        assert_eq!(scene_position(&shape), glam::Vec3::ZERO);
+
+        shape.set_position((0.5, 0.25));
+        assert_eq!(scene_position(&shape), glam::Vec3::new(0.5, 0.25, 0.0));
+    }
+}
@@ -143,6 +143,37 @@ impl Scene {
         object_id
     }
 
+    /// Adds a list of Objects to the Scene and returns their ObjectIDs.
+    ///
+    /// Works like calling [Scene::add()] for each Object, but the
+    /// Scene state is locked only once for the whole batch.
+    ///
+    /// Objects that are already part of a Scene are skipped
+    /// and their current ObjectId is returned instead.
+    pub fn add_many(&mut self, objects: &mut [&mut dyn SceneObject]) -> Vec<ObjectId> {
+        let mut object_ids = Vec::with_capacity(objects.len());
+        let mut added = Vec::with_capacity(objects.len());
+
+        let mut state = self.write_state();
+        for (index, object) in objects.iter_mut().enumerate() {
+            if let Some(object_id) = object.id() {
+                log::warn!("Object {:?} is already part of a Scene!", object_id);
+                object_ids.push(object_id);
+            } else {
+                object_ids.push(state.add(&mut **object));
+                added.push(index);
+            }
+        }
+        let scene_id = state.id();
+        drop(state);
+
+        for index in added {
+            objects[index].added_to_scene((scene_id, object_ids[index]), self.state.clone());
+        }
+
+        object_ids
+    }
+
     /// Counts the number of Objects in the Scene.
     pub fn count(&self) -> u32 {
         self.read_state().world.len()
@@ -365,7 +396,7 @@ impl SceneState {
     }
 
     /// Intenal implementation of the Scene.add() public method.
-    pub(crate) fn add(&mut self, object: &mut impl SceneObject) -> ObjectId {
+    pub(crate) fn add(&mut self, object: &mut (impl SceneObject + ?Sized)) -> ObjectId {
         let transform_id = self.add_to_scene_tree(object);
         object.added_to_scene_tree(transform_id);
 
@@ -376,7 +407,7 @@ impl SceneState {
     ///
     /// Adds the object to the Scene Tree if it has moved relative to its parent.
     /// Otherwise, the object will share the same Transform as its parent.
-    fn add_to_scene_tree(&mut self, object: &mut impl SceneObject) -> TransformId {
+    fn add_to_scene_tree(&mut self, object: &mut (impl SceneObject + ?Sized)) -> TransformId {
         if object.has_moved() {
             let index = self.transforms.len();
             self.transforms.push(object.transform());
@@ -391,7 +422,7 @@ impl SceneState {
     ///
     /// Adds the Object's components to the internal ECS World
     /// and returns the Entity ID (typed as ObjectId in our API).
-    fn add_to_scene(&mut self, object: &mut impl SceneObject) -> ObjectId {
+    fn add_to_scene(&mut self, object: &mut (impl SceneObject + ?Sized)) -> ObjectId {
         self.world.spawn(object.builder().build())
     }
 
@@ -545,6 +576,19 @@ mod tests {
         assert_eq!(scene.count(), 2);
     }
 
+    #[test]
+    fn test_add_many_to_scene() {
+        let mut scene = Scene::new_unregistered();
+        let mut shape1 = Circle::new(CircleOptions::default());
+        let mut shape2 = Circle::new(CircleOptions::default());
+        let existing_id = scene.add(&mut shape1);
+
+        let object_ids = scene.add_many(&mut [&mut shape1, &mut shape2]);
+
+        assert_eq!(object_ids, vec![existing_id, shape2.id().unwrap()]);
+        assert_eq!(scene.count(), 2);
+    }
+
     #[test]
     fn test_target_addition() {
         let mut scene = Scene::new_unregistered();
@@ -1,6 +1,7 @@
 use plr::*;
+use pyo3::exceptions::{PyKeyError, PyTypeError};
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::types::{PyDict, PyList, PyTuple};
 
 #[pyclass(name = "Window")]
 pub struct PyWindow {
@@ -9,13 +10,42 @@ pub struct PyWindow {
 
 unsafe impl Send for PyWindow {}
 
-#[derive(FromPyObject)]
 pub enum WindowSize {
     SizeTuple(u32, u32),
     SizeArray([u32; 2]),
     SizeDict { width: u32, height: u32 },
 }
 
+// Checks the concrete Python type directly instead of deriving
+// FromPyObject, which tries every variant in turn and builds
+// (then discards) a Python exception for each one that fails.
+impl<'source> FromPyObject<'source> for WindowSize {
+    fn extract(size: &'source PyAny) -> PyResult<Self> {
+        if let Ok(tuple) = size.downcast::<PyTuple>() {
+            let (width, height) = tuple.extract()?;
+            Ok(WindowSize::SizeTuple(width, height))
+        } else if let Ok(list) = size.downcast::<PyList>() {
+            Ok(WindowSize::SizeArray(list.extract()?))
+        } else if let Ok(dict) = size.downcast::<PyDict>() {
+            Ok(WindowSize::SizeDict {
+                width: size_item(dict, "width")?,
+                height: size_item(dict, "height")?,
+            })
+        } else {
+            Err(PyTypeError::new_err(
+                "Window size must be a (width, height) tuple, a [width, height] list \
+                 or a {\"width\": w, \"height\": h} dict",
+            ))
+        }
+    }
+}
+
+fn size_item(dict: &PyDict, key: &'static str) -> PyResult<u32> {
+    dict.get_item(key)?
+        .ok_or_else(|| PyKeyError::new_err(key))?
+        .extract()
+}
+
 #[pymethods]
 impl PyWindow {
     #[new]
@@ -5,7 +5,6 @@ use std::{
     convert::AsRef,
     fs,
     hash::Hash,
-    io::Write,
     path::{Path, PathBuf},
 };
 use syn::{
@@ -194,9 +193,15 @@ fn traverse_and_extract(
                         continue;
                     }
 
+                    // Parses the module once and reuses its items for every filter
+                    let (mod_path, mod_items) = parse_module(current_path, &item_mod);
                     reexported.unwrap().iter().for_each(|name_filter| {
-                        let (mod_path, mod_items) = parse_module(current_path, &item_mod);
-                        traverse_and_extract(&mod_path, mod_items, signatures, name_filter.clone());
+                        traverse_and_extract(
+                            &mod_path,
+                            mod_items.clone(),
+                            signatures,
+                            name_filter.clone(),
+                        );
                     });
                 }
             }
@@ -279,13 +284,19 @@ fn parse_module(current_path: &Path, current_module: &syn::ItemMod) -> (PathBuf,
 fn parse_external_module(current_path: &Path, module_name: String) -> (PathBuf, Vec<Item>) {
     let current_dir = current_path.parent().unwrap();
 
-    let module_path = if current_dir.join(format!("{}.rs", module_name)).exists() {
-        current_dir.join(format!("{}.rs", module_name))
-    } else {
-        current_dir.join(module_name).join("mod.rs")
+    let file_path = current_dir.join(format!("{}.rs", module_name));
+
+    // Tries the file module first and falls back to `mod.rs`,
+    // so each module costs a single successful read.
+    let (module_path, content) = match fs::read_to_string(&file_path) {
+        Ok(content) => (file_path, content),
+        Err(_) => {
+            let mod_path = current_dir.join(module_name).join("mod.rs");
+            let content = fs::read_to_string(&mod_path).expect("Failed to read module file");
+            (mod_path, content)
+        }
     };
 
-    let content = fs::read_to_string(&module_path).expect("Failed to read module file");
     (
         module_path,
         parse_file(&content)
@@ -440,32 +451,46 @@ fn extract_field(field: &syn::Field) -> ObjectProperty {
 }
 
 /// Exports the generated API map to a static Rust file
+///
+/// The file is left untouched if its contents would not change,
+/// so its mtime does not trigger needless rebuilds downstream.
 fn export_api_map(api_map: ApiMap, target_file: &Path) {
     let mut static_map_builder = phf_codegen::Map::new();
-    let mut target_file = fs::File::create(target_file).unwrap();
-    let mut writer = std::io::BufWriter::new(&mut target_file);
+
+    // Hash maps and sets have no stable iteration order, so both
+    // levels are sorted to make the generated file deterministic.
+    let mut api_map = Vec::from_iter(api_map);
+    api_map.sort_unstable_by(|(a, _), (b, _)| a.cmp(b));
 
     for (struct_name, functions) in api_map {
-        static_map_builder.entry(
-            struct_name.clone(),
-            &format!(
-                "&[{}]",
-                functions
-                    .iter()
-                    .map(|function| {
-                        format!("{:?}, ", function).replace("parameters: [", "parameters: &[")
-                    })
-                    .collect::<String>()
-            ),
-        );
+        let mut functions = functions
+            .iter()
+            .map(|function| format!("{:?}, ", function))
+            .collect::<Vec<String>>();
+        functions.sort_unstable();
+
+        static_map_builder.entry(struct_name, &format!("&[{}]", functions.concat()));
     }
 
-    write!(
-        &mut writer,
+    // The Debug output of a FunctionSignature prints its parameters
+    // as a Vec, while the static definition expects a slice reference.
+    // We fix them all at once in a single pass over the generated map.
+    let static_map = static_map_builder
+        .build()
+        .to_string()
+        .replace("parameters: [", "parameters: &[");
+
+    let content = format!(
         "{}\n\nstatic {}: phf::Map<&'static str, &[ObjectProperty]> = {};\n",
-        OBJECT_PROPERTY_STRUCT_DEFINITION,
-        API_MAP_KEYWORD,
-        static_map_builder.build()
-    )
-    .unwrap();
+        OBJECT_PROPERTY_STRUCT_DEFINITION, API_MAP_KEYWORD, static_map
+    );
+
+    if let Ok(current) = fs::read_to_string(target_file) {
+        if current == content {
+            println!("API map is up to date.");
+            return;
+        }
+    }
+
+    fs::write(target_file, content).unwrap();
 }
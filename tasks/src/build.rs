@@ -1,6 +1,8 @@
 use crate::{api_mapper, meta};
 use phf::phf_map;
-use std::process::Command;
+use std::process::{Command, ExitStatus};
+
+type Builder = fn(&str) -> ExitStatus;
 
 pub static ICON: phf::Map<&str, &str> = phf_map! {
     "fragmentcolor" => "⭕",
@@ -9,11 +11,11 @@ pub static ICON: phf::Map<&str, &str> = phf_map! {
     "fragmentcolor-py" => "🐍",
 };
 
-pub static BUILDER: phf::Map<&str, &str> = phf_map! {
-    "fragmentcolor" => "cargo",
-    "fragmentcolor-codegen" => "cargo",
-    "fragmentcolor-wasm" => "wasm",
-    "fragmentcolor-py" => "py",
+pub static BUILDER: phf::Map<&str, Builder> = phf_map! {
+    "fragmentcolor" => build_cargo as Builder,
+    "fragmentcolor-codegen" => build_cargo as Builder,
+    "fragmentcolor-wasm" => build_wasm as Builder,
+    "fragmentcolor-py" => build_py as Builder,
 };
 
 pub fn build_all() {
@@ -23,8 +25,13 @@ pub fn build_all() {
     build("fragmentcolor");
     api_mapper::map_public_api("fragmentcolor");
     //build("fragmentcolor-codegen");
-    build_cargo("fragmentcolor-wasm");
-    build_cargo("fragmentcolor-py");
+
+    // A single cargo invocation lets cargo compile
+    // both platform crates in parallel.
+    let platforms = ["fragmentcolor-wasm", "fragmentcolor-py"];
+    if !build_cargo_packages(&platforms).success() {
+        panic!("🛑 Compilation of {} failed!\n", platforms.join(", "));
+    }
 
     println!("🎉 All done! 🎉");
     println!();
@@ -35,11 +42,11 @@ pub fn build(crate_name: &str) {
         build_all()
     }
 
-    let builder = BUILDER.get(crate_name).unwrap_or(&"cargo");
+    let builder = BUILDER.get(crate_name).unwrap_or(&(build_cargo as Builder));
     let icon = ICON.get(crate_name).unwrap_or(&"📦");
     println!("\n{} Building {}...", icon, crate_name);
 
-    let status = compile_crate(crate_name, builder);
+    let status = builder(crate_name);
 
     if !status.success() {
         panic!("🛑 Compilation of {} failed!\n", crate_name);
@@ -48,23 +55,20 @@ pub fn build(crate_name: &str) {
     };
 }
 
-fn compile_crate(crate_name: &str, builder: &str) -> std::process::ExitStatus {
-    match builder {
-        "cargo" => build_cargo(crate_name),
-        "wasm" => build_wasm(crate_name),
-        "py" => build_py(crate_name),
-        _ => panic!("Unknown builder: {}", builder),
-    }
+fn build_cargo(crate_name: &str) -> ExitStatus {
+    build_cargo_packages(&[crate_name])
 }
 
-fn build_cargo(crate_name: &str) -> std::process::ExitStatus {
+fn build_cargo_packages(crate_names: &[&str]) -> ExitStatus {
+    let packages = crate_names.iter().flat_map(|&name| ["--package", name]);
     Command::new("cargo")
-        .args(["build", "--package", crate_name])
+        .arg("build")
+        .args(packages)
         .status()
-        .unwrap_or_else(|_| panic!("Failed to run build command for {}", crate_name))
+        .unwrap_or_else(|_| panic!("Failed to run build command for {}", crate_names.join(", ")))
 }
 
-fn build_wasm(crate_name: &str) -> std::process::ExitStatus {
+fn build_wasm(crate_name: &str) -> ExitStatus {
     let crate_root = meta::crate_root(crate_name);
     Command::new("wasm-pack")
         .args(["build"])
@@ -73,7 +77,7 @@ fn build_wasm(crate_name: &str) -> std::process::ExitStatus {
         .expect("Failed to run wasm-pack build command")
 }
 
-fn build_py(crate_name: &str) -> std::process::ExitStatus {
+fn build_py(crate_name: &str) -> ExitStatus {
     let crate_root = meta::crate_root(crate_name);
 
     Command::new("maturin")
@@ -2,9 +2,20 @@ use std::{
     fs,
     path::{Path, PathBuf},
     process::Command,
+    sync::OnceLock,
 };
 
+static WORKSPACE_ROOT: OnceLock<PathBuf> = OnceLock::new();
+
+/// Resolves the workspace root once per process.
+///
+/// Locating the project spawns a `cargo` subprocess, so the result
+/// is cached instead of being recomputed for every path lookup.
 pub fn workspace_root() -> PathBuf {
+    WORKSPACE_ROOT.get_or_init(locate_workspace_root).clone()
+}
+
+fn locate_workspace_root() -> PathBuf {
     let output = Command::new(env!("CARGO"))
         .arg("locate-project")
         .arg("--workspace")